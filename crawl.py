@@ -9,17 +9,30 @@ Usage:
 """
 
 import argparse
-import json
+import calendar
+import html
+import io
 import os
 import re
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
 
 import feedparser
+import orjson
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.retry import Retry
 
 DATA_DIR = Path(__file__).parent / "data"
 SCREENSHOTS_DIR = DATA_DIR / "screenshots"
@@ -41,80 +54,273 @@ HEADERS = {
 
 REQUEST_TIMEOUT = 15
 
+# Feed <link> tags live in <head>, so page fetches stop there (or at the limit)
+HTML_HEAD_CHUNK = 8 * 1024
+HTML_HEAD_LIMIT = 64 * 1024
+
+_URL_RE = re.compile(r"https?://")
+# Only things that look like tags, so plain-text "x < y" survives
+_TAG_RE = re.compile(r"</?[A-Za-z!?][^>]*>")
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_WS_RE = re.compile(r"\s+")
+
+# Dublin Core, used by RSS 1.0 and many RSS 2.0 feeds for entry dates
+DC_NS = "http://purl.org/dc/elements/1.1/"
+
+# RSS content module; Medium items carry their body only in content:encoded
+CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+
+SCREENSHOT_BLOCKED_RESOURCES = {"media", "font"}
+
+# Server-rendered sites that look the same without JavaScript; screenshot
+# them with a smaller viewport and scripts disabled
+STATIC_DOMAINS = {"news.ycombinator.com", "nav.al"}
+
+CHROMIUM_ARGS = ["--disable-gpu", "--no-sandbox", "--disable-dev-shm-usage"]
+
+# Write partial results after this many sources finish, so a crash keeps them
+CHECKPOINT_EVERY = 5
+
+# How long a discovered feed URL is trusted before discovery runs again
+FEED_CACHE_TTL = timedelta(days=7)
+
+# Sources are crawled concurrently; keep per-host concurrency low to stay polite
+MAX_WORKERS = 32
+MAX_PER_HOST = 2
+
+_host_slots: defaultdict[str, threading.Semaphore] = defaultdict(lambda: threading.Semaphore(MAX_PER_HOST))
+_host_slots_lock = threading.Lock()
+_log_buffer = threading.local()
+
+# In-flight and finished per-URL crawls, so a URL listed under several
+# sources is only fetched once
+_url_futures: dict[tuple, Future] = {}
+_url_futures_lock = threading.Lock()
+
+# Shared session so repeated requests to a host reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# Well-known path probes are speculative, so they fail fast instead of retrying
+PROBE_SESSION = requests.Session()
+PROBE_SESSION.headers.update(HEADERS)
+_probe_adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=0)
+PROBE_SESSION.mount("http://", _probe_adapter)
+PROBE_SESSION.mount("https://", _probe_adapter)
+
+# Per-feed validators and entries from the previous run, keyed by feed URL
+FEED_STATE: dict[str, dict] = {}
+
+# Discovered feed URLs from previous runs, keyed by source URL
+FEED_URL_CACHE: dict[str, dict] = {}
+
+# ETag/Last-Modified validators for source pages fetched during discovery
+PAGE_STATE: dict[str, dict] = {}
+
+
+def load_state() -> dict:
+    """Load the previous crawl state, or an empty dict if there is none."""
+    try:
+        return orjson.loads(STATE_FILE.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+
+def save_state(cutoff: datetime, results: list[dict | None]) -> None:
+    """Atomically write the crawl state, so an interrupted write can't corrupt it."""
+    state = {
+        "cutoff_date": cutoff.date(),
+        "crawled_at": datetime.now(timezone.utc),
+        "sources": [r for r in results if r is not None],
+        "feeds": FEED_STATE,
+        "feed_cache": FEED_URL_CACHE,
+        "pages": PAGE_STATE,
+    }
+
+    tmp_file = STATE_FILE.with_suffix(".tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(orjson.dumps(state, option=orjson.OPT_INDENT_2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, STATE_FILE)
+
 
 def parse_links_file(path: str) -> list[dict]:
     """Parse links.txt into a list of {name, urls}."""
     entries = []
     current = None
 
-    with open(path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                if current and current["urls"]:
-                    entries.append(current)
-                current = None
-                continue
-            if line.startswith("http://") or line.startswith("https://"):
-                if current is None:
-                    current = {"name": "", "urls": []}
-                current["urls"].append(line)
-            else:
-                current = {"name": line, "urls": []}
-
-    if current and current["urls"]:
+    for line in Path(path).read_text().splitlines():
+        line = line.strip()
+        if not line:
+            if current and current[1]:
+                entries.append(current)
+            current = None
+        elif _URL_RE.match(line):
+            if current is None:
+                current = ("", [])
+            current[1].append(line)
+        else:
+            current = (line, [])
+
+    if current and current[1]:
         entries.append(current)
 
-    return entries
+    return [{"name": name, "urls": urls} for name, urls in entries]
 
 
+@lru_cache(maxsize=1024)
 def domain_of(url: str) -> str:
     return urlparse(url).netloc.removeprefix("www.")
 
 
+@lru_cache(maxsize=1024)
+def base_url_of(url: str) -> str:
+    """Return the scheme://netloc part of url."""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
 def should_skip(url: str) -> bool:
     return domain_of(url) in SKIP_DOMAINS
 
 
+def log(message: str = "") -> None:
+    """Print a line, or buffer it if the current thread is crawling a source."""
+    lines = getattr(_log_buffer, "lines", None)
+    if lines is None:
+        print(message)
+    else:
+        lines.append(message)
+
+
+@contextmanager
+def host_slot(url: str):
+    """Limit the number of concurrent requests to a single host."""
+    with _host_slots_lock:
+        slot = _host_slots[domain_of(url)]
+    with slot:
+        yield
+
+
+def _read_html_head(resp: requests.Response) -> bytes:
+    """Read a streamed response up to </head>, or HTML_HEAD_LIMIT bytes."""
+    buf = bytearray()
+    for chunk in resp.iter_content(chunk_size=HTML_HEAD_CHUNK):
+        buf += chunk
+        # Re-check a few bytes before the new chunk in case the tag straddles it
+        if b"</head>" in buf[-len(chunk) - 6:].lower() or len(buf) >= HTML_HEAD_LIMIT:
+            break
+    return bytes(buf)
+
+
+def _conditional_headers(validators: dict) -> dict:
+    """Build If-None-Match/If-Modified-Since headers from stored validators."""
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("modified"):
+        headers["If-Modified-Since"] = validators["modified"]
+    return headers
+
+
 def discover_feed_from_html(url: str) -> str | None:
-    """Look for <link rel='alternate'> feed tags in page HTML."""
+    """Look for <link rel='alternate'> feed tags in page HTML.
+
+    If a feed URL is cached for the page, the page is fetched conditionally,
+    and when it hasn't changed since the last run that feed URL is returned
+    without a download.
+    """
+    cached = FEED_URL_CACHE.get(url)
+    # Without a cached feed URL a 304 tells us nothing, so fetch unconditionally
+    headers = _conditional_headers(PAGE_STATE.get(url, {})) if cached else {}
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-        resp.raise_for_status()
+        with host_slot(url), SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True) as resp:
+            if resp.status_code == 304 and cached:
+                return cached["feed_url"]
+            resp.raise_for_status()
+            head = _read_html_head(resp)
+            PAGE_STATE[url] = {"etag": resp.headers.get("ETag"), "modified": resp.headers.get("Last-Modified")}
     except requests.RequestException as e:
-        print(f"  [!] Failed to fetch {url}: {e}")
+        log(f"  [!] Failed to fetch {url}: {e}")
         return None
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = BeautifulSoup(head, "lxml")
     for link in soup.find_all("link", rel="alternate"):
         link_type = (link.get("type") or "").lower()
         if "rss" in link_type or "atom" in link_type:
             href = link.get("href", "")
             if href and not href.startswith("http"):
-                parsed = urlparse(url)
                 if href.startswith("/"):
-                    href = f"{parsed.scheme}://{parsed.netloc}{href}"
+                    href = f"{base_url_of(url)}{href}"
                 else:
-                    href = f"{parsed.scheme}://{parsed.netloc}/{href}"
+                    href = f"{base_url_of(url)}/{href}"
             if href:
                 return href
     return None
 
 
-def discover_feed_well_known(url: str) -> str | None:
-    """Try well-known feed paths."""
-    parsed = urlparse(url)
-    base = f"{parsed.scheme}://{parsed.netloc}"
+def _is_connect_failure(exc: BaseException) -> bool:
+    """Whether exc means no connection to the host could be made at all."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    if isinstance(exc, requests.ConnectionError) and exc.args:
+        return isinstance(getattr(exc.args[0], "reason", None), NewConnectionError)
+    return False
 
-    for path in WELL_KNOWN_FEED_PATHS:
-        feed_url = base + path
-        try:
-            resp = requests.head(feed_url, headers=HEADERS, timeout=REQUEST_TIMEOUT, allow_redirects=True)
-            content_type = resp.headers.get("content-type", "").lower()
-            if resp.status_code == 200 and ("xml" in content_type or "rss" in content_type or "atom" in content_type):
-                return feed_url
-        except requests.RequestException:
-            continue
+
+def _probe_feed_url(feed_url: str) -> str | None:
+    """HEAD a candidate feed URL and return it if it serves a feed.
+
+    Connect-level failures are raised, so the caller can give up on an
+    unreachable host instead of probing its other paths.
+    """
+    try:
+        with host_slot(feed_url):
+            resp = PROBE_SESSION.head(feed_url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
+    except requests.RequestException as e:
+        if _is_connect_failure(e):
+            raise
+        return None
+    content_type = resp.headers.get("content-type", "").lower()
+    if resp.status_code == 200 and ("xml" in content_type or "rss" in content_type or "atom" in content_type):
+        return feed_url
+    return None
+
+
+def discover_feed_well_known(url: str) -> str | None:
+    """Try well-known feed paths concurrently.
+
+    The first path (in WELL_KNOWN_FEED_PATHS order) that serves a feed wins,
+    so the choice is stable across runs. It is returned as soon as every
+    higher-priority probe has answered.
+    """
+    base = base_url_of(url)
+
+    # All probes hit one host, so more workers than MAX_PER_HOST would only queue
+    # on the host semaphore where they can no longer be cancelled
+    executor = ThreadPoolExecutor(max_workers=MAX_PER_HOST)
+    futures = [executor.submit(_probe_feed_url, base + path) for path in WELL_KNOWN_FEED_PATHS]
+    pending = set(futures)
+    responded = False
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            responded = responded or any(future.exception() is None for future in done)
+            if not responded and any(_is_connect_failure(future.exception()) for future in done):
+                # The host is unreachable; don't wait out the remaining probes
+                return None
+            # Any other probe error is just a miss for that path
+            for future in futures:
+                if not future.done():
+                    break
+                if future.exception() is None and future.result():
+                    return future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
     return None
 
@@ -126,7 +332,8 @@ def discover_feed_platform(url: str) -> str | None:
         if platform_domain in domain:
             feed_url = make_feed_url(url)
             try:
-                resp = requests.head(feed_url, headers=HEADERS, timeout=REQUEST_TIMEOUT, allow_redirects=True)
+                with host_slot(feed_url):
+                    resp = SESSION.head(feed_url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
                 if resp.status_code == 200:
                     return feed_url
             except requests.RequestException:
@@ -135,74 +342,301 @@ def discover_feed_platform(url: str) -> str | None:
 
 
 def discover_feed(url: str) -> str | None:
-    """Try all feed discovery strategies."""
-    feed_url = discover_feed_from_html(url)
+    """Try all feed discovery strategies, cheapest first."""
+    feed_url = discover_feed_platform(url)
     if feed_url:
         return feed_url
 
-    feed_url = discover_feed_platform(url)
+    feed_url = discover_feed_well_known(url)
     if feed_url:
         return feed_url
 
-    feed_url = discover_feed_well_known(url)
+    feed_url = discover_feed_from_html(url)
     if feed_url:
         return feed_url
 
     return None
 
 
+def cached_feed_url(url: str) -> str | None:
+    """Return the feed URL discovered for url on a previous run, if still fresh."""
+    cached = FEED_URL_CACHE.get(url)
+    if not cached:
+        return None
+    discovered_at = datetime.fromisoformat(cached["discovered_at"])
+    if datetime.now(timezone.utc) - discovered_at > FEED_CACHE_TTL:
+        return None
+    return cached["feed_url"]
+
+
+def remember_feed_url(url: str, feed_url: str) -> None:
+    FEED_URL_CACHE[url] = {
+        "feed_url": feed_url,
+        "discovered_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def forget_feed_url(url: str) -> None:
+    """Drop the cached feed URL, and the page validators that would shortcut to it."""
+    FEED_URL_CACHE.pop(url, None)
+    PAGE_STATE.pop(url, None)
+
+
 def parse_feed_date(entry) -> datetime | None:
     """Extract a datetime from a feed entry."""
     for attr in ("published_parsed", "updated_parsed"):
         t = getattr(entry, attr, None)
         if t:
             try:
-                from time import mktime
-                return datetime.fromtimestamp(mktime(t), tz=timezone.utc)
+                return datetime.fromtimestamp(calendar.timegm(t), tz=timezone.utc)
             except (ValueError, OverflowError):
                 pass
     return None
 
 
-def fetch_feed_entries(feed_url: str, cutoff: datetime) -> list[dict]:
-    """Parse an RSS/Atom feed and return entries newer than cutoff."""
-    feed = feedparser.parse(feed_url, agent=HEADERS["User-Agent"])
+def _parse_date(text: str | None) -> datetime | None:
+    """Parse an RFC 822 (RSS) or ISO 8601 (Atom) date into an aware UTC datetime."""
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        dt = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _child_text(elem, *tags: str) -> str | None:
+    """Return the text of the first child matching one of tags (in Clark notation)."""
+    for tag in tags:
+        child = elem.find(tag)
+        if child is not None:
+            return "".join(child.itertext()).strip()
+    return None
+
+
+def _entry_title(elem, ns: str) -> str:
+    title = elem.find(f"{ns}title")
+    if title is None:
+        return "Untitled"
+    text = "".join(title.itertext()).strip()
+    # lxml has already decoded XML entities; only type="html" titles carry a
+    # second layer of escaped markup
+    if title.get("type") == "html":
+        text = _TAG_RE.sub("", html.unescape(text)).strip()
+    return text or "Untitled"
+
+
+def _entry_link(elem, ns: str, feed_url: str) -> str:
+    """Return the entry's link, made absolute against xml:base and the feed URL."""
+    for link in elem.iterfind(f"{ns}link"):
+        href = link.get("href")
+        if href is None:
+            href = (link.text or "").strip()
+            if not href:
+                continue
+        elif link.get("rel", "alternate") != "alternate":
+            continue
+        return urljoin(urljoin(feed_url, link.base or ""), href)
+    return ""
+
+
+def _parse_feed_xml(body: bytes, feed_url: str) -> list[dict]:
+    """Read RSS items / Atom entries without keeping the whole tree in memory."""
+    entries = []
+    for _, elem in etree.iterparse(io.BytesIO(body), events=("end",), tag=("{*}entry", "{*}item"), resolve_entities=False):
+        # Only read children in the entry's own namespace (none for RSS 2.0), so
+        # extensions like media:title don't shadow the real fields
+        namespace = etree.QName(elem).namespace
+        ns = f"{{{namespace}}}" if namespace else ""
+        entry_date = _parse_date(_child_text(elem, f"{ns}published", f"{ns}pubDate", f"{{{DC_NS}}}date", f"{ns}updated"))
+        entries.append({
+            "title": _entry_title(elem, ns),
+            "url": _entry_link(elem, ns, feed_url),
+            "date": entry_date.isoformat() if entry_date else None,
+            "summary": _clean_summary(
+                _child_text(elem, f"{ns}summary", f"{ns}description", f"{ns}content", f"{{{CONTENT_NS}}}encoded") or ""
+            ),
+        })
+        # Drop the parsed entry and its earlier siblings to keep memory flat
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+    return entries
+
+
+def _parse_feed_fallback(body: bytes, feed_url: str, headers) -> list[dict]:
+    """Parse an already fetched feed with feedparser, for documents lxml rejects."""
+    # content-location gives feedparser the base URL for relative entry links.
+    # _clean_summary strips markup anyway, so skip feedparser's costly HTML
+    # sanitising and relative URI rewriting of content
+    response_headers = {k.lower(): v for k, v in headers.items()}
+    response_headers["content-location"] = feed_url
+    feed = feedparser.parse(
+        body,
+        response_headers=response_headers,
+        sanitize_html=False,
+        resolve_relative_uris=False,
+    )
     if feed.bozo and not feed.entries:
         return []
 
     entries = []
     for entry in feed.entries:
         entry_date = parse_feed_date(entry)
-        if entry_date and entry_date < cutoff:
-            continue
-
         entries.append({
             "title": entry.get("title", "Untitled"),
             "url": entry.get("link", ""),
             "date": entry_date.isoformat() if entry_date else None,
             "summary": _clean_summary(entry.get("summary", "")),
         })
-
     return entries
 
 
+def fetch_feed_entries(feed_url: str, cutoff: datetime) -> list[dict] | None:
+    """Parse an RSS/Atom feed and return entries newer than cutoff.
+
+    Sends the ETag/Last-Modified validators from the previous run, and reuses
+    the previously parsed entries when the server answers 304 Not Modified.
+    Returns None if the feed URL itself is gone (HTTP 404/410); other errors
+    such as 429 or 503 are treated as a failed fetch.
+    """
+    cached = FEED_STATE.get(feed_url, {})
+    headers = _conditional_headers(cached)
+
+    try:
+        with host_slot(feed_url):
+            # Read the body through requests so truncated or badly encoded
+            # responses surface as RequestException rather than urllib3 errors
+            resp = SESSION.get(feed_url, headers=headers, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        log(f"  [!] Failed to fetch feed {feed_url}: {e}")
+        return []
+
+    if resp.status_code in (404, 410):
+        return None
+    if resp.status_code >= 400:
+        log(f"  [!] Failed to fetch feed {feed_url}: HTTP {resp.status_code}")
+        return []
+    if resp.status_code == 304:
+        return _entries_since(cached.get("entries", []), cutoff)
+
+    validators = {"etag": resp.headers.get("ETag"), "modified": resp.headers.get("Last-Modified")}
+    try:
+        entries = _parse_feed_xml(resp.content, feed_url)
+    except etree.XMLSyntaxError:
+        entries = _parse_feed_fallback(resp.content, feed_url, resp.headers)
+
+    # Keep every entry so a later run with an earlier cutoff can still use them
+    FEED_STATE[feed_url] = {**validators, "entries": entries}
+
+    return _entries_since(entries, cutoff)
+
+
+def _entries_since(entries: list[dict], cutoff: datetime) -> list[dict]:
+    # Entry dates are always stored as UTC ISO 8601 strings, which sort
+    # chronologically, so compare them as text instead of parsing each one
+    cutoff_iso = cutoff.astimezone(timezone.utc).isoformat()
+    return [e for e in entries if not e["date"] or e["date"] >= cutoff_iso]
+
+
 def _clean_summary(text: str) -> str:
     """Strip HTML tags and truncate summary."""
-    clean = BeautifulSoup(text, "html.parser").get_text(separator=" ").strip()
-    clean = re.sub(r"\s+", " ", clean)
+    text = _TAG_RE.sub(" ", _SCRIPT_STYLE_RE.sub(" ", text))
+    clean = _WS_RE.sub(" ", html.unescape(text)).strip()
     if len(clean) > 300:
         clean = clean[:300] + "..."
     return clean
 
 
-def take_screenshot(url: str) -> str | None:
-    """Take a headless screenshot of a URL. Returns the file path or None."""
-    try:
+def _block_unneeded_resources(route) -> None:
+    """Skip media and fonts, which don't change an above-the-fold screenshot much."""
+    if route.request.resource_type in SCREENSHOT_BLOCKED_RESOURCES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+class Screenshotter:
+    """A headless Chromium shared by every screenshot in a run.
+
+    Playwright's sync API is bound to the thread that started it, so the
+    browser lives on one dedicated thread and crawl workers submit to it.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot")
+        self._playwright = None
+        self._browser = None
+        self._launch_error = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._executor.submit(self._close).result()
+        self._executor.shutdown()
+
+    def capture(self, url: str, filepath: Path) -> None:
+        self._executor.submit(self._capture, url, filepath).result()
+
+    def _capture(self, url: str, filepath: Path) -> None:
+        if self._launch_error is not None:
+            raise self._launch_error
+        if self._browser is None:
+            try:
+                self._start_browser()
+            except Exception as e:
+                # e.g. Playwright or its Chromium isn't installed; don't retry per URL
+                self._launch_error = e
+                raise
+
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+        if domain_of(url) in STATIC_DOMAINS:
+            context = self._browser.new_context(viewport={"width": 1024, "height": 768}, java_script_enabled=False)
+        else:
+            context = self._browser.new_context(viewport={"width": 1280, "height": 800})
+        try:
+            context.route("**/*", _block_unneeded_resources)
+            page = context.new_page()
+            # "networkidle" never settles on pages with analytics beacons, so wait for
+            # the DOM and give the load event a short, best-effort grace period
+            page.goto(url, wait_until="domcontentloaded", timeout=15000)
+            try:
+                page.wait_for_load_state("load", timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
+            page.screenshot(path=str(filepath), full_page=False)
+        finally:
+            context.close()
+
+    def _start_browser(self) -> None:
         from playwright.sync_api import sync_playwright
-    except ImportError:
-        print("  [!] Playwright not installed, skipping screenshot")
-        return None
 
+        playwright = sync_playwright().start()
+        try:
+            browser = playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        except Exception:
+            playwright.stop()
+            raise
+        self._playwright = playwright
+        self._browser = browser
+
+    def _close(self) -> None:
+        if self._browser is not None:
+            self._browser.close()
+        if self._playwright is not None:
+            self._playwright.stop()
+
+
+def take_screenshot(url: str, screenshotter: Screenshotter) -> str | None:
+    """Take a headless screenshot of a URL. Returns the file path or None."""
     SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
     domain = domain_of(url)
     date_str = datetime.now().strftime("%Y-%m-%d")
@@ -210,21 +644,94 @@ def take_screenshot(url: str) -> str | None:
     filepath = SCREENSHOTS_DIR / filename
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page(viewport={"width": 1280, "height": 800})
-            page.goto(url, wait_until="networkidle", timeout=30000)
-            page.screenshot(path=str(filepath), full_page=False)
-            browser.close()
-        print(f"  [+] Screenshot saved: {filepath}")
-        return str(filepath.relative_to(Path(__file__).parent))
+        screenshotter.capture(url, filepath)
+    except ImportError:
+        log("  [!] Playwright not installed, skipping screenshot")
+        return None
     except Exception as e:
-        print(f"  [!] Screenshot failed for {url}: {e}")
+        log(f"  [!] Screenshot failed for {url}: {e}")
         return None
 
+    log(f"  [+] Screenshot saved: {filepath}")
+    return str(filepath.relative_to(Path(__file__).parent))
+
+
+def normalize_url(url: str) -> str:
+    """Key used to spot the same URL listed under several sources."""
+    parsed = urlparse(url)
+    key = f"{parsed.scheme.lower()}://{parsed.netloc.lower()}{parsed.path.rstrip('/')}"
+    # The query often selects different content, so it must stay in the key
+    if parsed.query:
+        key += f"?{parsed.query}"
+    return key
+
+
+def _crawl_url(url: str, cutoff: datetime, screenshotter: Screenshotter | None) -> dict:
+    """Look for new feed entries for one URL, falling back to a screenshot."""
+    outcome = {"feed_url": None, "entries": [], "screenshot": None}
+
+    log(f"  Trying RSS for {url}...")
+    feed_url = cached_feed_url(url)
+    if feed_url:
+        log(f"  [+] Cached feed: {feed_url}")
+    else:
+        feed_url = discover_feed(url)
+        if feed_url:
+            log(f"  [+] Found feed: {feed_url}")
+            remember_feed_url(url, feed_url)
+
+    if feed_url:
+        entries = fetch_feed_entries(feed_url, cutoff)
+        if entries is None:
+            log(f"  [!] Feed unavailable, forgetting {feed_url}")
+            forget_feed_url(url)
+        elif entries:
+            outcome["feed_url"] = feed_url
+            outcome["entries"] = entries
+            log(f"  [+] {len(entries)} new entries since {cutoff.date()}")
+            return outcome
+        else:
+            log(f"  [~] Feed found but no entries after cutoff")
+    elif screenshotter is None:
+        log(f"  [~] No feed found")
+
+    if screenshotter is None:
+        # RSS-only mode: skip screenshot fallback
+        return outcome
+
+    # Fallback to screenshot
+    log(f"  [~] No usable feed, taking screenshot...")
+    outcome["screenshot"] = take_screenshot(url, screenshotter)
+    return outcome
+
 
-def crawl_source(name: str, urls: list[str], cutoff: datetime) -> dict:
-    """Crawl a single source (may have multiple URLs)."""
+def _crawl_url_once(url: str, cutoff: datetime, screenshotter: Screenshotter | None) -> dict:
+    """Crawl a URL, sharing the outcome with any other source that lists it."""
+    key = (normalize_url(url), cutoff, screenshotter is None)
+    with _url_futures_lock:
+        future = _url_futures.get(key)
+        owner = future is None
+        if owner:
+            future = _url_futures[key] = Future()
+
+    if not owner:
+        log(f"  [=] {url} is shared with another source, reusing its result")
+        return future.result()
+
+    try:
+        outcome = _crawl_url(url, cutoff, screenshotter)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    future.set_result(outcome)
+    return outcome
+
+
+def crawl_source(name: str, urls: list[str], cutoff: datetime, screenshotter: Screenshotter | None = None) -> dict:
+    """Crawl a single source (may have multiple URLs).
+
+    Without a screenshotter this runs in RSS-only mode.
+    """
     result = {
         "name": name,
         "urls": urls,
@@ -236,38 +743,38 @@ def crawl_source(name: str, urls: list[str], cutoff: datetime) -> dict:
 
     for url in urls:
         if should_skip(url):
-            print(f"  [-] Skipping {url} (blocked domain)")
+            log(f"  [-] Skipping {url} (blocked domain)")
             continue
 
-        print(f"  Trying RSS for {url}...")
-        feed_url = discover_feed(url)
-
-        if feed_url:
-            print(f"  [+] Found feed: {feed_url}")
-            entries = fetch_feed_entries(feed_url, cutoff)
-            if entries:
-                result["method"] = "rss"
-                result["feed_url"] = feed_url
-                result["new_entries"].extend(entries)
-                print(f"  [+] {len(entries)} new entries since {cutoff.date()}")
-                continue
-            else:
-                print(f"  [~] Feed found but no entries after cutoff")
-
-        # Fallback to screenshot
-        print(f"  [~] No usable feed, taking screenshot...")
-        screenshot_path = take_screenshot(url)
-        if screenshot_path:
-            result["screenshots"].append(screenshot_path)
+        outcome = _crawl_url_once(url, cutoff, screenshotter)
+        if outcome["entries"]:
+            result["method"] = "rss"
+            result["feed_url"] = outcome["feed_url"]
+            result["new_entries"].extend(outcome["entries"])
+        elif outcome["screenshot"]:
+            result["screenshots"].append(outcome["screenshot"])
             if not result["method"]:
                 result["method"] = "screenshot"
 
     if not result["method"]:
-        result["method"] = "failed"
+        result["method"] = "failed" if screenshotter else "no_feed"
 
     return result
 
 
+def _crawl_source_buffered(
+    name: str, urls: list[str], cutoff: datetime, screenshotter: Screenshotter | None
+) -> tuple[dict, list[str]]:
+    """Run crawl_source in a worker thread, collecting its log lines."""
+    _log_buffer.lines = [f"[{name}]"]
+    try:
+        result = crawl_source(name, urls, cutoff, screenshotter)
+    finally:
+        lines = _log_buffer.lines
+        del _log_buffer.lines
+    return result, lines
+
+
 def main():
     parser = argparse.ArgumentParser(description="ReadNext crawler")
     parser.add_argument(
@@ -297,56 +804,34 @@ def main():
     print(f"Found {len(sources)} sources in links.txt\n")
 
     DATA_DIR.mkdir(parents=True, exist_ok=True)
+    previous_state = load_state()
+    FEED_STATE.update(previous_state.get("feeds", {}))
+    FEED_URL_CACHE.update(previous_state.get("feed_cache", {}))
+    PAGE_STATE.update(previous_state.get("pages", {}))
 
-    results = []
-    for source in sources:
-        name = source["name"]
-        urls = source["urls"]
-        print(f"[{name}]")
-
-        if args.no_screenshots:
-            # RSS-only mode: skip screenshot fallback
-            result = {
-                "name": name,
-                "urls": urls,
-                "method": None,
-                "feed_url": None,
-                "new_entries": [],
-                "screenshots": [],
-            }
-            for url in urls:
-                if should_skip(url):
-                    print(f"  [-] Skipping {url}")
-                    continue
-                print(f"  Trying RSS for {url}...")
-                feed_url = discover_feed(url)
-                if feed_url:
-                    print(f"  [+] Found feed: {feed_url}")
-                    entries = fetch_feed_entries(feed_url, cutoff)
-                    if entries:
-                        result["method"] = "rss"
-                        result["feed_url"] = feed_url
-                        result["new_entries"].extend(entries)
-                        print(f"  [+] {len(entries)} new entries since {cutoff.date()}")
-                    else:
-                        print(f"  [~] Feed found but no entries after cutoff")
-                else:
-                    print(f"  [~] No feed found")
-            if not result["method"]:
-                result["method"] = "no_feed"
-            results.append(result)
-        else:
-            results.append(crawl_source(name, urls, cutoff))
-        print()
-
-    state = {
-        "cutoff_date": str(cutoff.date()),
-        "crawled_at": datetime.now(timezone.utc).isoformat(),
-        "sources": results,
-    }
-
-    with open(STATE_FILE, "w") as f:
-        json.dump(state, f, indent=2)
+    results = [None] * len(sources)
+    screenshotter_context = nullcontext() if args.no_screenshots else Screenshotter()
+    try:
+        with screenshotter_context as screenshotter:
+            executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+            try:
+                futures = {
+                    executor.submit(_crawl_source_buffered, source["name"], source["urls"], cutoff, screenshotter): i
+                    for i, source in enumerate(sources)
+                }
+                for done, future in enumerate(as_completed(futures), start=1):
+                    result, lines = future.result()
+                    results[futures[future]] = result
+                    print("\n".join(lines))
+                    print()
+                    if done % CHECKPOINT_EVERY == 0:
+                        save_state(cutoff, results)
+            finally:
+                # On Ctrl-C or a failed source, don't start the sources still queued
+                executor.shutdown(wait=False, cancel_futures=True)
+    finally:
+        # Runs on interrupt too, so sources finished since the last checkpoint survive
+        save_state(cutoff, results)
 
     print(f"---")
     print(f"Results written to {STATE_FILE}")